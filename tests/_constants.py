@@ -0,0 +1,27 @@
+"""
+Constants shared by the Mergington High School API test modules
+"""
+
+import json
+from pathlib import Path
+
+
+# Store the initial state of activities (seed data lives in a JSON file)
+INITIAL_ACTIVITIES = json.loads(
+    (Path(__file__).parent / "_initial_activities.json").read_text()
+)
+
+SIGNUP_URL = "/activities/{}/signup?email={}"
+REMOVE_URL = "/activities/{}/participants/{}"
+
+EXPECTED_ACTIVITIES = frozenset({
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Soccer Team",
+    "Basketball Club",
+    "Art Studio",
+    "Drama Society",
+    "Debate Club",
+    "Math Olympiad"
+})
@@ -4,98 +4,178 @@ Pytest configuration and fixtures for Mergington High School API tests
 
 import pytest
 from fastapi.testclient import TestClient
-from copy import deepcopy
-from src.app import app, activities
-
-
-# Store the initial state of activities
-INITIAL_ACTIVITIES = {
-    "Chess Club": {
-        "description": "Learn strategies and compete in chess tournaments",
-        "schedule": "Fridays, 3:30 PM - 5:00 PM",
-        "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-    },
-    "Programming Class": {
-        "description": "Learn programming fundamentals and build software projects",
-        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-        "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-    },
-    "Gym Class": {
-        "description": "Physical education and sports activities",
-        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-        "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-    },
-    "Soccer Team": {
-        "description": "Team-based soccer training and competitive matches",
-        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
-        "max_participants": 22,
-        "participants": ["liam@mergington.edu", "noah@mergington.edu"]
-    },
-    "Basketball Club": {
-        "description": "Practice basketball fundamentals and play weekly scrimmages",
-        "schedule": "Tuesdays and Thursdays, 4:00 PM - 5:30 PM",
-        "max_participants": 18,
-        "participants": ["ava@mergington.edu", "mia@mergington.edu"]
-    },
-    "Art Studio": {
-        "description": "Explore painting, sketching, and mixed media art",
-        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-        "max_participants": 15,
-        "participants": ["isabella@mergington.edu", "charlotte@mergington.edu"]
-    },
-    "Drama Society": {
-        "description": "Acting workshops and school theater productions",
-        "schedule": "Fridays, 4:00 PM - 6:00 PM",
-        "max_participants": 25,
-        "participants": ["amelia@mergington.edu", "harper@mergington.edu"]
-    },
-    "Debate Club": {
-        "description": "Develop public speaking and argumentation skills through debates",
-        "schedule": "Thursdays, 3:30 PM - 5:00 PM",
-        "max_participants": 16,
-        "participants": ["ethan@mergington.edu", "james@mergington.edu"]
-    },
-    "Math Olympiad": {
-        "description": "Solve advanced math problems and prepare for competitions",
-        "schedule": "Mondays, 3:30 PM - 5:00 PM",
-        "max_participants": 14,
-        "participants": ["lucas@mergington.edu", "benjamin@mergington.edu"]
-    }
+from src.app import app, activities as app_activities, get_activities_db
+from tests._constants import INITIAL_ACTIVITIES
+
+
+# Labeled email addresses shared (read-only) by all tests
+_SAMPLE_EMAILS = {
+    "new_student": "newstudent@mergington.edu",
+    "another_student": "anotherstudent@mergington.edu",
+    "test_user": "testuser@example.com",
+    "existing_chess": "michael@mergington.edu",  # Already in Chess Club
+    "existing_programming": "emma@mergington.edu"  # Already in Programming Class
 }
 
 
-@pytest.fixture
+def _clone_activities(schema, participants):
+    """
+    Builds a fresh activities dictionary that is safe to mutate.
+
+    Args:
+        schema: Activity name mapped to (description, schedule, max_participants)
+        participants: Activity name mapped to a tuple of participant emails
+    """
+    # Shallow clone is sufficient: strings/ints are immutable; only
+    # participant lists need copying.
+    return {
+        name: {
+            "description": description,
+            "schedule": schedule,
+            "max_participants": max_participants,
+            "participants": list(participants[name])
+        }
+        for name, (description, schedule, max_participants) in schema.items()
+    }
+
+
+@pytest.fixture(scope="session")
 def client():
     """
     Provides a FastAPI TestClient instance for making HTTP requests to the API.
     
     This fixture creates a test client that can be used to make requests to the
-    application without running a server.
+    application without running a server. The client holds no activity state,
+    so a single instance is shared across the whole test session. Using the
+    client as a context manager runs the app's startup and shutdown exactly
+    once, around the whole session.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def _immutable_activity_schema():
+    """
+    Provides the parts of INITIAL_ACTIVITIES that the API never modifies.
+    
+    Returns:
+        dict: Activity name mapped to (description, schedule, max_participants)
+    """
+    return {
+        name: (data["description"], data["schedule"], data["max_participants"])
+        for name, data in INITIAL_ACTIVITIES.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def _initial_participants():
+    """
+    Provides the initial participants of every activity.
+    
+    Returns:
+        dict: Activity name mapped to a tuple of participant emails
+    """
+    return {
+        name: tuple(data["participants"])
+        for name, data in INITIAL_ACTIVITIES.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def _shared_activities(_immutable_activity_schema, _initial_participants):
+    """
+    Provides one activities dictionary shared by all read-only tests.
+    
+    Returns:
+        dict: A copy of INITIAL_ACTIVITIES that tests must not modify
     """
-    return TestClient(app)
+    return _clone_activities(_immutable_activity_schema, _initial_participants)
 
 
 @pytest.fixture(autouse=True)
-def reset_activities():
+def reset_activities(
+    request, _immutable_activity_schema, _initial_participants, _shared_activities
+):
     """
-    Resets the activities dictionary to its initial state before each test.
+    Gives each test its own activities dictionary in its initial state.
     
     This fixture runs automatically before each test (autouse=True) to ensure
     test isolation by preventing tests from affecting each other through shared state.
-    Uses deepcopy to ensure complete independence of the data structure.
+    A fresh dictionary is built with _clone_activities and handed to the API by
+    overriding the get_activities_db dependency, so the module-level data in
+    src.app is never modified and nothing needs to be reset afterwards.
+
+    Tests marked with ``no_reset`` promise not to modify activities, so they
+    all share a single dictionary instead of getting their own copy.
+
+    Yields:
+        dict: The activities dictionary used by the API during the test
+    """
+    if request.node.get_closest_marker("no_reset") is not None:
+        state = _shared_activities
+    else:
+        state = _clone_activities(_immutable_activity_schema, _initial_participants)
+    app.dependency_overrides[get_activities_db] = lambda: state
+    yield state
+    app.dependency_overrides.pop(get_activities_db, None)
+
+
+@pytest.fixture
+def activities(reset_activities):
+    """
+    Provides the activities dictionary the API is using for the current test.
+    
+    Returns:
+        dict: The activities mapping, keyed by activity name
+    """
+    return reset_activities
+
+
+@pytest.fixture
+def module_activities(reset_activities):
+    """
+    Provides the real module-level activities with no dependency override.
+    
+    The API reads and writes src.app.activities directly during the test.
+    Its participant lists are restored afterwards so later tests are unaffected.
+
+    Yields:
+        dict: The module-level activities mapping from src.app
+    """
+    app.dependency_overrides.pop(get_activities_db, None)
+    saved_participants = {
+        name: list(data["participants"])
+        for name, data in app_activities.items()
+    }
+    yield app_activities
+    for name, participants in saved_participants.items():
+        app_activities[name]["participants"][:] = participants
+
+
+@pytest.fixture(scope="session")
+def initial_activities():
+    """
+    Provides the pristine activities data that every reset restores.
+    
+    Returns:
+        dict: The initial activities mapping (must not be modified)
     """
-    activities.clear()
-    activities.update(deepcopy(INITIAL_ACTIVITIES))
-    yield
-    # Teardown: reset again after the test
-    activities.clear()
-    activities.update(deepcopy(INITIAL_ACTIVITIES))
+    return INITIAL_ACTIVITIES
 
 
 @pytest.fixture
+def activities_snapshot(client, reset_activities):
+    """
+    Provides the decoded GET /activities response for the current test.
+    
+    Returns:
+        dict: The activities as returned by the API
+    """
+    return client.get("/activities").json()
+
+
+@pytest.fixture(scope="session")
 def sample_emails():
     """
     Provides a list of sample email addresses for testing.
@@ -103,10 +183,4 @@ def sample_emails():
     Returns:
         dict: A dictionary with labeled test email addresses
     """
-    return {
-        "new_student": "newstudent@mergington.edu",
-        "another_student": "anotherstudent@mergington.edu",
-        "test_user": "testuser@example.com",
-        "existing_chess": "michael@mergington.edu",  # Already in Chess Club
-        "existing_programming": "emma@mergington.edu"  # Already in Programming Class
-    }
+    return _SAMPLE_EMAILS
@@ -10,9 +10,16 @@ Tests cover:
 """
 
 import pytest
-from urllib.parse import quote
+from functools import lru_cache
+from urllib.parse import quote as _quote
+from src.app import get_activities_db
+from tests._constants import EXPECTED_ACTIVITIES, REMOVE_URL, SIGNUP_URL
 
+# URL-encoding is pure, so repeated encodings of the same values are cached
+quote = lru_cache(maxsize=32)(_quote)
 
+
+@pytest.mark.no_reset
 class TestRootEndpoint:
     """Tests for the root endpoint (/)"""
 
@@ -23,6 +30,7 @@ class TestRootEndpoint:
         assert response.headers["location"] == "/static/index.html"
 
 
+@pytest.mark.no_reset
 class TestGetActivities:
     """Tests for the GET /activities endpoint"""
 
@@ -35,37 +43,19 @@ class TestGetActivities:
         assert isinstance(activities, dict)
         assert len(activities) == 9
 
-    def test_get_activities_has_required_fields(self, client):
+    def test_get_activities_has_required_fields(self, activities_snapshot):
         """Test that each activity has required fields"""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        for activity_name, activity_data in activities.items():
+        for activity_name, activity_data in activities_snapshot.items():
             assert "description" in activity_data
             assert "schedule" in activity_data
             assert "max_participants" in activity_data
             assert "participants" in activity_data
             assert isinstance(activity_data["participants"], list)
 
-    def test_get_activities_includes_all_expected_activities(self, client):
+    def test_get_activities_includes_all_expected_activities(self, activities_snapshot):
         """Test that all expected activities are present"""
-        response = client.get("/activities")
-        activities = response.json()
-        
-        expected_activities = [
-            "Chess Club",
-            "Programming Class",
-            "Gym Class",
-            "Soccer Team",
-            "Basketball Club",
-            "Art Studio",
-            "Drama Society",
-            "Debate Club",
-            "Math Olympiad"
-        ]
-        
-        for expected in expected_activities:
-            assert expected in activities
+        missing = EXPECTED_ACTIVITIES - activities_snapshot.keys()
+        assert not missing, f"{sorted(missing)} not found in activities"
 
 
 class TestSignupEndpoint:
@@ -76,21 +66,19 @@ class TestSignupEndpoint:
         activity_name = "Chess Club"
         email = sample_emails["new_student"]
         
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        response = client.post(SIGNUP_URL.format(activity_name, email))
         assert response.status_code == 200
         assert response.json() == {"message": f"Signed up {email} for {activity_name}"}
 
-    def test_signup_adds_participant_to_activity(self, client, sample_emails):
+    def test_signup_adds_participant_to_activity(self, activities, client, sample_emails):
         """Test that signup actually adds the participant to the activity"""
         activity_name = "Programming Class"
         email = sample_emails["new_student"]
         
         # Sign up
-        client.post(f"/activities/{activity_name}/signup?email={email}")
+        client.post(SIGNUP_URL.format(activity_name, email))
         
         # Verify participant was added
-        response = client.get("/activities")
-        activities = response.json()
         assert email in activities[activity_name]["participants"]
 
     def test_signup_with_url_encoded_activity_name(self, client, sample_emails):
@@ -99,13 +87,13 @@ class TestSignupEndpoint:
         encoded_name = quote(activity_name)
         email = sample_emails["new_student"]
         
-        response = client.post(f"/activities/{encoded_name}/signup?email={email}")
+        response = client.post(SIGNUP_URL.format(encoded_name, email))
         assert response.status_code == 200
 
     def test_signup_activity_not_found(self, client, sample_emails):
         """Test 404 error when activity doesn't exist"""
         response = client.post(
-            f"/activities/Nonexistent Activity/signup?email={sample_emails['new_student']}"
+            SIGNUP_URL.format("Nonexistent Activity", sample_emails['new_student'])
         )
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
@@ -115,47 +103,43 @@ class TestSignupEndpoint:
         activity_name = "Chess Club"
         email = sample_emails["existing_chess"]  # michael@mergington.edu is already in Chess Club
         
-        response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        response = client.post(SIGNUP_URL.format(activity_name, email))
         assert response.status_code == 400
         assert response.json()["detail"] == "Student already signed up"
 
-    def test_signup_multiple_students_same_activity(self, client, sample_emails):
+    def test_signup_multiple_students_same_activity(self, activities, client, sample_emails):
         """Test multiple students can sign up for the same activity"""
         activity_name = "Math Olympiad"
         
         # Sign up first student
         response1 = client.post(
-            f"/activities/{activity_name}/signup?email={sample_emails['new_student']}"
+            SIGNUP_URL.format(activity_name, sample_emails['new_student'])
         )
         assert response1.status_code == 200
         
         # Sign up second student
         response2 = client.post(
-            f"/activities/{activity_name}/signup?email={sample_emails['another_student']}"
+            SIGNUP_URL.format(activity_name, sample_emails['another_student'])
         )
         assert response2.status_code == 200
         
         # Verify both are in the activity
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert sample_emails['new_student'] in activities[activity_name]["participants"]
         assert sample_emails['another_student'] in activities[activity_name]["participants"]
 
-    def test_signup_student_for_multiple_activities(self, client, sample_emails):
+    def test_signup_student_for_multiple_activities(self, activities, client, sample_emails):
         """Test a student can sign up for multiple activities"""
         email = sample_emails["new_student"]
         
         # Sign up for Chess Club
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
+        response1 = client.post(SIGNUP_URL.format("Chess Club", email))
         assert response1.status_code == 200
         
         # Sign up for Programming Class
-        response2 = client.post(f"/activities/Programming Class/signup?email={email}")
+        response2 = client.post(SIGNUP_URL.format("Programming Class", email))
         assert response2.status_code == 200
         
         # Verify student is in both activities
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert email in activities["Chess Club"]["participants"]
         assert email in activities["Programming Class"]["participants"]
 
@@ -168,21 +152,19 @@ class TestRemoveParticipantEndpoint:
         activity_name = "Chess Club"
         email = sample_emails["existing_chess"]  # michael@mergington.edu
         
-        response = client.delete(f"/activities/{activity_name}/participants/{email}")
+        response = client.delete(REMOVE_URL.format(activity_name, email))
         assert response.status_code == 200
         assert response.json() == {"message": f"Removed {email} from {activity_name}"}
 
-    def test_remove_participant_actually_removes(self, client, sample_emails):
+    def test_remove_participant_actually_removes(self, activities, client, sample_emails):
         """Test that removal actually removes the participant from the activity"""
         activity_name = "Programming Class"
         email = sample_emails["existing_programming"]  # emma@mergington.edu
         
         # Remove participant
-        client.delete(f"/activities/{activity_name}/participants/{email}")
+        client.delete(REMOVE_URL.format(activity_name, email))
         
         # Verify participant was removed
-        response = client.get("/activities")
-        activities = response.json()
         assert email not in activities[activity_name]["participants"]
 
     def test_remove_participant_with_url_encoded_activity_name(self, client, sample_emails):
@@ -191,7 +173,7 @@ class TestRemoveParticipantEndpoint:
         encoded_name = quote(activity_name)
         email = sample_emails["existing_chess"]
         
-        response = client.delete(f"/activities/{encoded_name}/participants/{email}")
+        response = client.delete(REMOVE_URL.format(encoded_name, email))
         assert response.status_code == 200
 
     def test_remove_participant_with_url_encoded_email(self, client):
@@ -200,13 +182,13 @@ class TestRemoveParticipantEndpoint:
         email = "michael@mergington.edu"
         encoded_email = quote(email)
         
-        response = client.delete(f"/activities/{activity_name}/participants/{encoded_email}")
+        response = client.delete(REMOVE_URL.format(activity_name, encoded_email))
         assert response.status_code == 200
 
     def test_remove_participant_activity_not_found(self, client, sample_emails):
         """Test 404 error when activity doesn't exist"""
         response = client.delete(
-            f"/activities/Nonexistent Activity/participants/{sample_emails['new_student']}"
+            REMOVE_URL.format("Nonexistent Activity", sample_emails['new_student'])
         )
         assert response.status_code == 404
         assert response.json()["detail"] == "Activity not found"
@@ -216,33 +198,47 @@ class TestRemoveParticipantEndpoint:
         activity_name = "Chess Club"
         email = sample_emails["new_student"]  # This student is not in Chess Club
         
-        response = client.delete(f"/activities/{activity_name}/participants/{email}")
+        response = client.delete(REMOVE_URL.format(activity_name, email))
         assert response.status_code == 404
         assert response.json()["detail"] == "Student not found in activity"
 
-    def test_signup_then_remove_then_signup_again(self, client, sample_emails):
+    def test_signup_then_remove_then_signup_again(self, activities, client, sample_emails):
         """Test that a student can be removed and then sign up again"""
         activity_name = "Basketball Club"
         email = sample_emails["new_student"]
         
         # Sign up
-        signup_response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        signup_response = client.post(SIGNUP_URL.format(activity_name, email))
         assert signup_response.status_code == 200
         
         # Remove
-        remove_response = client.delete(f"/activities/{activity_name}/participants/{email}")
+        remove_response = client.delete(REMOVE_URL.format(activity_name, email))
         assert remove_response.status_code == 200
         
         # Sign up again
-        signup_again_response = client.post(f"/activities/{activity_name}/signup?email={email}")
+        signup_again_response = client.post(SIGNUP_URL.format(activity_name, email))
         assert signup_again_response.status_code == 200
         
         # Verify student is in the activity
-        activities_response = client.get("/activities")
-        activities = activities_response.json()
         assert email in activities[activity_name]["participants"]
 
 
+class TestActivitiesDependency:
+    """Tests for the real activities dependency, without test overrides"""
+
+    def test_dependency_returns_module_activities(self, module_activities):
+        """Test that get_activities_db provides the module-level activities"""
+        assert get_activities_db() is module_activities
+
+    def test_signup_updates_module_activities(self, client, module_activities, sample_emails):
+        """Test that a signup is stored in the module-level activities"""
+        email = sample_emails["new_student"]
+        
+        response = client.post(SIGNUP_URL.format("Chess Club", email))
+        assert response.status_code == 200
+        assert email in module_activities["Chess Club"]["participants"]
+
+
 class TestEdgeCases:
     """Tests for edge cases and special scenarios"""
 
@@ -250,17 +246,17 @@ class TestEdgeCases:
         """Test that activity names are case-sensitive"""
         # Try with wrong case
         response = client.post(
-            f"/activities/chess club/signup?email={sample_emails['new_student']}"
+            SIGNUP_URL.format("chess club", sample_emails['new_student'])
         )
         assert response.status_code == 404
 
     def test_list_activities_after_modifications(self, client, sample_emails):
         """Test that GET /activities reflects all modifications"""
         # Add a participant to Chess Club
-        client.post(f"/activities/Chess Club/signup?email={sample_emails['new_student']}")
+        client.post(SIGNUP_URL.format("Chess Club", sample_emails['new_student']))
         
         # Remove a participant from Programming Class
-        client.delete(f"/activities/Programming Class/participants/{sample_emails['existing_programming']}")
+        client.delete(REMOVE_URL.format("Programming Class", sample_emails['existing_programming']))
         
         # Get activities and verify changes
         response = client.get("/activities")